@@ -16,12 +16,24 @@ import os
 import sys
 import threading
 import queue
+import io
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 import time
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import ctypes
+import struct
+import mmap
+import plistlib
+
+if sys.platform.startswith("win"):
+    import msvcrt
+else:
+    import fcntl
 
 # ------------- cache warm core -------------
 
@@ -30,26 +42,99 @@ DEFAULT_PATTERNS = [
     "*.mixins.json", "*.mcmeta", "*.png", "*.jpg", "*.ogg", "*.wav", "*.txt"
 ]
 
-SKIP_DIRNAMES = {
+# Pruned during the walk, at any depth. Compared lowercased because Windows and
+# macOS volumes are case-insensitive and launchers are not consistent about
+# "Screenshots" vs "screenshots".
+SKIP_DIRNAMES = frozenset({
     ".git", ".gradle", ".idea", "logs", "crash-reports", "screenshots", "shaderpacks"
+})
+
+def _scandir_walk(root):
+    # Pruned top-down like os.walk(topdown=True), but files keep the DirEntry's
+    # cached stat, which os.walk throws away. An explicit stack instead of
+    # nested generators keeps the cost per file flat however deep the tree is.
+    # Skipped directories are never opened. Like os.walk, symlinked dirs are
+    # not descended but symlinked files are followed and warmed.
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower() not in SKIP_DIRNAMES:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path, entry.name, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+# Heavy folders whose first two levels get listed ahead of the walk
+PRIME_DIRNAMES = ("mods", "config", "resourcepacks")
+
+def _subdirs(path):
+    try:
+        with os.scandir(path) as it:
+            return [entry.path for entry in it
+                    if entry.is_dir(follow_symlinks=False) and entry.name.lower() not in SKIP_DIRNAMES]
+    except OSError:
+        return []
+
+def prime_dir_cache(root):
+    # On a cold NFS/CIFS share every directory open is a round trip and the
+    # walk pays them one at a time. Listing the top of the heavy folders in
+    # parallel first leaves their dentries and inodes cached for the walk.
+    tops = []
+    for base in (root, os.path.join(root, ".minecraft"), os.path.join(root, "minecraft")):
+        tops.extend(os.path.join(base, name) for name in PRIME_DIRNAMES)
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        children = [c for sub in pool.map(_subdirs, tops) for c in sub]
+        for _ in pool.map(_subdirs, children):
+            pass
+
+# Warm order: jars first, then zips, configs, assets, everything else
+WEIGHTS = {
+    "jar": 0,
+    "zip": 1,
+    "json": 2, "toml": 2, "cfg": 2, "ini": 2,
+    "png": 3, "ogg": 3, "wav": 3,
 }
+OTHER_WEIGHT = 4
+
+def ext_weights(patterns):
+    # Extension (no dot) -> warm weight for every extension the patterns
+    # match. Membership and weight come out of the same lookup.
+    # "*.mixins.json" is already covered by "json".
+    return {
+        ext: WEIGHTS.get(ext, OTHER_WEIGHT)
+        for ext in (p.rpartition(".")[2].lower() for p in patterns)
+    }
+
+EXT_WEIGHTS = ext_weights(DEFAULT_PATTERNS)
 
 def iter_files(root: Path, patterns):
-    seen = set()
-    for pattern in patterns:
-        for p in root.rglob(pattern):
-            try:
-                if not p.is_file():
-                    continue
-                key = (p.resolve() if p.exists() else p)
-                if key in seen:
-                    continue
-                seen.add(key)
-                if any(part in SKIP_DIRNAMES for part in p.parts):
-                    continue
-                yield p
-            except Exception:
-                continue
+    # Yields (path, stat, weight) with path as a plain str. The stat is the one
+    # cached by the walk so callers never need to stat again.
+    # One walk, one dict lookup per filename, whatever the number of patterns
+    table = EXT_WEIGHTS if patterns is DEFAULT_PATTERNS else ext_weights(patterns)
+    for path, name, st in _scandir_walk(root):
+        _, dot, ext = name.lower().rpartition(".")
+        w = table.get(ext) if dot else None
+        if w is None:
+            continue
+        yield path, st, w
+
+def sort_for_warm(files, rotational=None):
+    # Weight buckets first. Inside a bucket, inode order is a cheap stand-in
+    # for on-disk order since inodes allocated together usually sit close on
+    # ext4, xfs and apfs. SSDs do not care about order, and Windows stats carry
+    # no inode, so those keep biggest first.
+    if rotational is False or sys.platform.startswith("win"):
+        files.sort(key=lambda f: (f[2], -f[1].st_size))
+    else:
+        files.sort(key=lambda f: (f[2], f[1].st_dev, f[1].st_ino))
 
 def human(n):
     units = ["B","KB","MB","GB","TB","PB"]
@@ -59,18 +144,588 @@ def human(n):
         i += 1
     return f"{n:.1f} {units[i]}"
 
-def warm_file(path: Path, chunk_mb=16):
-    size = path.stat().st_size
+# Per-call cap for F_RDADVISE hints
+HINT_WINDOW = 128 * 1024 * 1024
+
+# Linux clamps each WILLNEED/readahead call to the device readahead size,
+# the rest of the range is silently dropped. 128 KiB is the kernel default
+# for read_ahead_kb, so windows of this size are honoured in full.
+LINUX_HINT_WINDOW = 128 * 1024
+
+# macOS fcntl command, not exported by the fcntl module
+F_RDADVISE = 44
+
+def _load_readahead():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).readahead
+        fn.argtypes = [ctypes.c_int, ctypes.c_longlong, ctypes.c_size_t]
+        fn.restype = ctypes.c_ssize_t
+        return fn
+    except Exception:
+        return None
+
+_readahead = _load_readahead()
+
+# A file counts as already hot when this share of its pages is resident
+HOT_FRACTION = 0.95
+
+def _load_libc():
+    # mmap/mincore/munmap straight from libc so mincore gets a real address
+    if sys.platform.startswith("win"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int,
+                              ctypes.c_int, ctypes.c_int, ctypes.c_longlong]
+        libc.mmap.restype = ctypes.c_void_p
+        libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        libc.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p]
+        return libc
+    except Exception:
+        return None
+
+_libc = _load_libc()
+
+def _is_resident(fd, size):
+    # True if at least HOT_FRACTION of the file is already in the page cache
+    if _libc is None:
+        return False
+    addr = _libc.mmap(None, size, mmap.PROT_READ, mmap.MAP_SHARED, fd, 0)
+    if addr is None or addr == ctypes.c_void_p(-1).value:
+        return False
+    try:
+        pages = (size + mmap.PAGESIZE - 1) // mmap.PAGESIZE
+        vec = (ctypes.c_ubyte * pages)()
+        if _libc.mincore(addr, size, vec) != 0:
+            return False
+        return pages - bytes(vec).count(0) >= HOT_FRACTION * pages
+    finally:
+        _libc.munmap(addr, size)
+
+def _hint_linux(fd, size):
+    off = 0
+    while off < size:
+        n = min(LINUX_HINT_WINDOW, size - off)
+        try:
+            os.posix_fadvise(fd, off, n, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            if _readahead is None or _readahead(fd, off, n) != 0:
+                raise
+        off += n
+
+def _hint_darwin(fd, size):
+    # struct radvisory { off_t ra_offset; int ra_count; }, padded to 16 bytes
+    off = 0
+    while off < size:
+        n = min(HINT_WINDOW, size - off)
+        fcntl.fcntl(fd, F_RDADVISE, struct.pack("qi4x", off, n))
+        off += n
+
+# Files over 1 GiB get their madvise split into windows of this size so the
+# kernel never queues a whole modpack archive at once
+MADVISE_WINDOW = 256 * 1024 * 1024
+
+def _hint_mmap(fd, size):
+    with mmap.mmap(fd, size, prot=mmap.PROT_READ) as mm:
+        window = size if size <= 1 << 30 else MADVISE_WINDOW
+        off = 0
+        while off < size:
+            n = min(window, size - off)
+            mm.madvise(mmap.MADV_WILLNEED, off, n)
+            off += n
+
+def _hint_other(fd, size):
+    # No posix_fadvise (macOS and friends). mmap+madvise first, F_RDADVISE if
+    # that is refused.
+    try:
+        _hint_mmap(fd, size)
+    except (OSError, AttributeError):
+        if sys.platform != "darwin":
+            raise
+        _hint_darwin(fd, size)
+
+def _open_sequential_win(path):
+    # CreateFileW with FILE_FLAG_SEQUENTIAL_SCAN so the cache manager reads
+    # ahead aggressively, then wrap the handle as a CRT fd
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateFileW.restype = ctypes.c_void_p
+    handle = kernel32.CreateFileW(
+        path,
+        0x80000000,  # GENERIC_READ
+        0x00000007,  # FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE
+        None,
+        3,           # OPEN_EXISTING
+        0x08000000,  # FILE_FLAG_SEQUENTIAL_SCAN
+        None,
+    )
+    if handle is None or handle == ctypes.c_void_p(-1).value:
+        raise ctypes.WinError()
+    return msvcrt.open_osfhandle(handle, os.O_RDONLY)
+
+# Linux lets sendfile(2) write to /dev/null, which reads the file through the
+# page cache without a copy into user space. macOS only sends to sockets.
+SENDFILE_NULL = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+SENDFILE_MAX = 0x7FFFF000  # the kernel's per-call cap
+
+_null_fd = None
+_null_lock = threading.Lock()
+
+def _devnull_fd():
+    # Opened once and shared by every pool thread
+    global _null_fd
+    if _null_fd is None:
+        with _null_lock:
+            if _null_fd is None:
+                _null_fd = os.open(os.devnull, os.O_WRONLY | os.O_CLOEXEC)
+    return _null_fd
+
+def _sendfile_null(fd, size):
+    out = _devnull_fd()
+    off = 0
+    while off < size:
+        n = os.sendfile(out, fd, off, min(SENDFILE_MAX, size - off))
+        if n == 0:
+            break
+        off += n
+    return off
+
+def _chunk_for(size):
+    # A 2 KB .mcmeta does not need a 16 MiB buffer, a big jar wants big reads
+    if size < 1 << 20:
+        return 64 * 1024
+    if size < 16 << 20:
+        return 1 << 20
+    return 16 << 20
+
+_tls = threading.local()
+
+def _scratch(n):
+    # One reusable read buffer per pool thread, grown on demand
+    buf = getattr(_tls, "buf", None)
+    if buf is None or len(buf) < n:
+        buf = _tls.buf = bytearray(n)
+    return memoryview(buf)[:n]
+
+def _read_fd(fd, size):
+    chunk = _chunk_for(size)
+    view = _scratch(chunk)
     total = 0
-    with open(path, "rb", buffering=0) as f:
-        chunk = max(1, int(chunk_mb * 1024 * 1024))
-        while True:
-            data = f.read(chunk)
-            if not data:
+    with io.FileIO(fd, closefd=False) as f:
+        while total < size:
+            n = f.readinto(view[:min(chunk, size - total)])
+            if not n:
                 break
-            total += len(data)
+            total += n
     return total
 
+def warm_file(path: str, size: int, rotational=None):
+    # size is the scan-time size. On Linux the kernel reads the file via
+    # sendfile to /dev/null, on macOS it is asked to read ahead, either way
+    # nothing is copied into Python. Returns (bytes, hot) where hot means the
+    # file was already cached and was left alone.
+    if sys.platform.startswith("win"):
+        try:
+            fd = _open_sequential_win(path)
+        except OSError:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            return _read_fd(fd, size), False
+        finally:
+            os.close(fd)
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        # An empty file has nothing left to cache
+        if size <= 0 or _is_resident(fd, size):
+            return size, True
+        if SENDFILE_NULL:
+            try:
+                if rotational and hasattr(os, "posix_fadvise"):
+                    # Spinning disk: doubles the readahead window for the
+                    # sequential read sendfile is about to do
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                return _sendfile_null(fd, size), False
+            except OSError:
+                # Some filesystems refuse splice reads, hint instead
+                pass
+        if hasattr(os, "posix_fadvise"):
+            _hint_linux(fd, size)
+        else:
+            try:
+                _hint_other(fd, size)
+            except (OSError, AttributeError):
+                return _read_fd(fd, size), False
+    finally:
+        os.close(fd)
+    return size, False
+
+# ------------- small-file batches -------------
+
+# Files up to BATCH_FILE_MAX are read in one shot. io_uring takes up to
+# BATCH_SIZE files per io_uring_enter call. Without it, the preadv fallback
+# uses smaller groups so more of them run side by side on the pool.
+BATCH_FILE_MAX = 64 * 1024
+BATCH_SIZE = 512
+PREADV_BATCH_SIZE = 32
+
+IORING_OP_READ = 22
+IORING_ENTER_GETEVENTS = 1
+IORING_OFF_SQ_RING = 0
+IORING_OFF_CQ_RING = 0x8000000
+IORING_OFF_SQES = 0x10000000
+SYS_io_uring_setup = 425
+SYS_io_uring_enter = 426
+
+class _SQRingOffsets(ctypes.Structure):
+    _fields_ = [(n, ctypes.c_uint32) for n in (
+        "head", "tail", "ring_mask", "ring_entries", "flags", "dropped", "array", "resv1"
+    )] + [("user_addr", ctypes.c_uint64)]
+
+class _CQRingOffsets(ctypes.Structure):
+    _fields_ = [(n, ctypes.c_uint32) for n in (
+        "head", "tail", "ring_mask", "ring_entries", "overflow", "cqes", "flags", "resv1"
+    )] + [("user_addr", ctypes.c_uint64)]
+
+class _URingParams(ctypes.Structure):
+    _fields_ = [(n, ctypes.c_uint32) for n in (
+        "sq_entries", "cq_entries", "flags", "sq_thread_cpu", "sq_thread_idle", "features", "wq_fd"
+    )] + [("resv", ctypes.c_uint32 * 3), ("sq_off", _SQRingOffsets), ("cq_off", _CQRingOffsets)]
+
+_libc_syscall = None
+
+def _syscall(*args):
+    ret = _libc_syscall(*args)
+    if ret < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return ret
+
+# Rings whose requests could not be waited out are parked here instead of
+# freed, the kernel may still be writing into their buffer
+_stuck_rings = []
+
+class _URing:
+    # Bare io_uring through raw syscalls, only what batched reads need. The
+    # read buffer belongs to the ring so it cannot be freed while requests
+    # that target it are still in flight.
+
+    def __init__(self, entries, buf_len):
+        self.buf = ctypes.create_string_buffer(buf_len)
+        self.inflight = 0
+        self.params = p = _URingParams()
+        self.fd = _syscall(SYS_io_uring_setup, ctypes.c_uint(entries), ctypes.byref(p))
+        self.maps = []
+        try:
+            self.sq = self._map(p.sq_off.array + p.sq_entries * 4, IORING_OFF_SQ_RING)
+            self.cq = self._map(p.cq_off.cqes + p.cq_entries * 16, IORING_OFF_CQ_RING)
+            self.sqes = self._map(p.sq_entries * 64, IORING_OFF_SQES)
+        except Exception:
+            self.close()
+            raise
+
+    def _map(self, length, offset):
+        m = mmap.mmap(self.fd, length, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE, offset=offset)
+        self.maps.append(m)
+        return m
+
+    def close(self):
+        if self.inflight:
+            _stuck_rings.append(self)
+            return
+        for m in self.maps:
+            m.close()
+        os.close(self.fd)
+
+    def _enter(self, to_submit, min_complete):
+        return _syscall(SYS_io_uring_enter, ctypes.c_int(self.fd), ctypes.c_uint(to_submit),
+                        ctypes.c_uint(min_complete), ctypes.c_uint(IORING_ENTER_GETEVENTS),
+                        None, ctypes.c_size_t(0))
+
+    def _reap(self, results):
+        p = self.params
+        cq_mask = struct.unpack_from("I", self.cq, p.cq_off.ring_mask)[0]
+        head = struct.unpack_from("I", self.cq, p.cq_off.head)[0]
+        tail = struct.unpack_from("I", self.cq, p.cq_off.tail)[0]
+        while head != tail:
+            user_data, res = struct.unpack_from("=Qi", self.cq, p.cq_off.cqes + (head & cq_mask) * 16)
+            if results is not None:
+                results[user_data] = res
+            self.inflight -= 1
+            head = (head + 1) & 0xFFFFFFFF
+        struct.pack_into("I", self.cq, p.cq_off.head, head)
+
+    def _drain(self):
+        # Wait out whatever is still in flight. If even that fails, inflight
+        # stays non-zero and close() parks the ring.
+        while self.inflight:
+            try:
+                self._enter(0, self.inflight)
+            except InterruptedError:
+                pass
+            except OSError:
+                return
+            self._reap(None)
+
+    def read_all(self, fds, length, rw_flags=0):
+        # One IORING_OP_READ at offset 0 per fd, all into the ring's buffer.
+        # Returns the cqe result per fd, bytes read or -errno.
+        p = self.params
+        addr = ctypes.addressof(self.buf)
+        sq_tail = struct.unpack_from("I", self.sq, p.sq_off.tail)[0]
+        sq_mask = struct.unpack_from("I", self.sq, p.sq_off.ring_mask)[0]
+        for k, fd in enumerate(fds):
+            idx = (sq_tail + k) & sq_mask
+            # opcode, flags, ioprio, fd, off, addr, len, rw_flags, user_data
+            struct.pack_into("=BBHiQQIIQ24x", self.sqes, idx * 64,
+                             IORING_OP_READ, 0, 0, fd, 0, addr, length, rw_flags, k)
+            struct.pack_into("I", self.sq, p.sq_off.array + idx * 4, idx)
+        struct.pack_into("I", self.sq, p.sq_off.tail, (sq_tail + len(fds)) & 0xFFFFFFFF)
+
+        results = [None] * len(fds)
+        to_submit = len(fds)
+        while to_submit or self.inflight:
+            try:
+                submitted = self._enter(to_submit, to_submit + self.inflight)
+                to_submit -= submitted
+                self.inflight += submitted
+            except InterruptedError:
+                pass
+            except OSError:
+                self._drain()
+                raise
+            self._reap(results)
+        return results
+
+_uring_ok = None
+
+def _uring_available():
+    # IORING_OP_READ needs 5.6. Containers and hardened kernels often block
+    # io_uring outright, so probe once with a real ring.
+    global _uring_ok, _libc_syscall
+    if _uring_ok is None:
+        _uring_ok = False
+        if sys.platform.startswith("linux"):
+            try:
+                release = os.uname().release.split("-")[0].split(".")
+                if tuple(int(x) for x in release[:2]) >= (5, 6):
+                    _libc_syscall = ctypes.CDLL(None, use_errno=True).syscall
+                    _libc_syscall.restype = ctypes.c_long
+                    _URing(2, 0).close()
+                    _uring_ok = True
+            except Exception:
+                pass
+    return _uring_ok
+
+# A RWF_NOWAIT read only succeeds from the page cache, so one full read doubles
+# as the residency check for small files: much cheaper than mmap+mincore.
+# Anything else (EAGAIN, a short read, no support) means read it normally.
+RWF_NOWAIT = getattr(os, "RWF_NOWAIT", 0)
+
+def _warm_batch_iouring(batch):
+    out = [None] * len(batch)
+    fds = []
+    cold = []
+    slots = []
+    try:
+        for k, (path, size) in enumerate(batch):
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            except OSError as e:
+                out[k] = e
+                continue
+            fds.append(fd)
+            if size <= 0:
+                out[k] = (0, True)
+            else:
+                cold.append(fd)
+                slots.append(k)
+        if cold:
+            ring = _URing(len(cold), BATCH_FILE_MAX)
+            try:
+                retry = []
+                if RWF_NOWAIT:
+                    for fd, k, res in zip(cold, slots, ring.read_all(cold, BATCH_FILE_MAX, RWF_NOWAIT)):
+                        if res >= batch[k][1]:
+                            out[k] = (res, True)
+                        else:
+                            retry.append((fd, k))
+                else:
+                    retry = list(zip(cold, slots))
+                if retry:
+                    results = ring.read_all([fd for fd, _ in retry], BATCH_FILE_MAX)
+                    for (_, k), res in zip(retry, results):
+                        out[k] = (res, False) if res >= 0 else OSError(-res, os.strerror(-res))
+            finally:
+                ring.close()
+    finally:
+        for fd in fds:
+            os.close(fd)
+    return out
+
+def _warm_batch_preadv(batch):
+    # open, one preadv into a shared scratch buffer, close
+    buf = _scratch(BATCH_FILE_MAX)
+    out = []
+    for path, size in batch:
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            try:
+                if size <= 0:
+                    out.append((0, True))
+                    continue
+                if RWF_NOWAIT:
+                    try:
+                        n = os.preadv(fd, [buf], 0, RWF_NOWAIT)
+                    except OSError:
+                        n = -1
+                    if n >= size:
+                        out.append((n, True))
+                        continue
+                out.append((os.preadv(fd, [buf], 0), False))
+            finally:
+                os.close(fd)
+        except OSError as e:
+            out.append(e)
+    return out
+
+def batch_size():
+    return BATCH_SIZE if _uring_available() else PREADV_BATCH_SIZE
+
+def warm_batch(batch, rotational=None):
+    # batch is a list of (path, size). Returns one entry per file, the
+    # (bytes, hot) pair from warm_file or the exception that file raised.
+    # Several small files go through io_uring where it works, then preadv,
+    # everything else through warm_file.
+    if len(batch) > 1:
+        if _uring_available():
+            try:
+                return _warm_batch_iouring(batch)
+            except OSError:
+                pass
+        if hasattr(os, "preadv"):
+            return _warm_batch_preadv(batch)
+    out = []
+    for path, size in batch:
+        try:
+            out.append(warm_file(path, size, rotational))
+        except Exception as e:
+            out.append(e)
+    return out
+
+def _mount_point(path):
+    path = os.path.realpath(path)
+    dev = os.stat(path).st_dev
+    while True:
+        parent = os.path.dirname(path)
+        if parent == path or os.stat(parent).st_dev != dev:
+            return path
+        path = parent
+
+def _sysfs_rotational(base):
+    # Partitions keep the queue settings on the parent disk
+    for q in (base + "/queue/rotational", base + "/../queue/rotational"):
+        if os.path.exists(q):
+            with open(q) as f:
+                return f.read().strip() == "1"
+    return None
+
+def _rotational_linux(path):
+    st_dev = os.stat(path).st_dev
+    found = _sysfs_rotational(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+    if found is not None:
+        return found
+    # btrfs and friends report an anonymous st_dev, go through the mount table
+    mnt = _mount_point(path)
+    device = None
+    with open("/proc/mounts") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) > 1 and fields[1].replace("\\040", " ") == mnt:
+                device = fields[0]
+    if device and device.startswith("/dev/"):
+        name = os.path.basename(os.path.realpath(device))
+        return _sysfs_rotational(f"/sys/class/block/{name}")
+    return None
+
+class _StoragePropertyQuery(ctypes.Structure):
+    _fields_ = [("PropertyId", ctypes.c_int), ("QueryType", ctypes.c_int),
+                ("AdditionalParameters", ctypes.c_ubyte * 1)]
+
+class _SeekPenaltyDescriptor(ctypes.Structure):
+    _fields_ = [("Version", ctypes.c_uint32), ("Size", ctypes.c_uint32),
+                ("IncursSeekPenalty", ctypes.c_ubyte)]
+
+def _rotational_win(path):
+    drive = os.path.splitdrive(os.path.abspath(path))[0]
+    if not drive or drive.startswith("\\\\"):
+        return None  # UNC share
+    kernel32 = ctypes.windll.kernel32
+    if kernel32.GetDriveTypeW(drive + "\\") == 2:  # DRIVE_REMOVABLE
+        return True
+    # Opening the volume with no access rights is enough for the query and
+    # does not need admin
+    kernel32.CreateFileW.restype = ctypes.c_void_p
+    handle = kernel32.CreateFileW("\\\\.\\" + drive, 0, 0x00000003, None, 3, 0, None)
+    if handle is None or handle == ctypes.c_void_p(-1).value:
+        return None
+    try:
+        query = _StoragePropertyQuery(7, 0)  # StorageDeviceSeekPenaltyProperty, PropertyStandardQuery
+        desc = _SeekPenaltyDescriptor()
+        returned = ctypes.c_uint32()
+        ok = kernel32.DeviceIoControl(
+            ctypes.c_void_p(handle), 0x002D1400,  # IOCTL_STORAGE_QUERY_PROPERTY
+            ctypes.byref(query), ctypes.sizeof(query),
+            ctypes.byref(desc), ctypes.sizeof(desc),
+            ctypes.byref(returned), None,
+        )
+        return bool(desc.IncursSeekPenalty) if ok else None
+    finally:
+        kernel32.CloseHandle(ctypes.c_void_p(handle))
+
+def _rotational_darwin(path):
+    out = subprocess.run(
+        ["diskutil", "info", "-plist", _mount_point(path)],
+        capture_output=True, timeout=10, check=True,
+    ).stdout
+    info = plistlib.loads(out)
+    if "SolidState" in info:
+        return not info["SolidState"]
+    return None
+
+_device_cache = {}
+
+def _probe_device(path):
+    # True for spinning or removable media, False for SSD/NVMe, None if
+    # unknown. Cached per device, diskutil in particular is slow.
+    try:
+        st_dev = os.stat(path).st_dev
+    except OSError:
+        return None
+    if st_dev not in _device_cache:
+        rotational = None
+        try:
+            if sys.platform.startswith("linux"):
+                rotational = _rotational_linux(path)
+            elif sys.platform.startswith("win"):
+                rotational = _rotational_win(path)
+            elif sys.platform == "darwin":
+                rotational = _rotational_darwin(path)
+        except Exception:
+            pass
+        _device_cache[st_dev] = rotational
+    return _device_cache[st_dev]
+
+def io_workers(rotational):
+    # SSD/NVMe need several requests in flight to reach full bandwidth,
+    # spinning disks only seek more with a deep queue
+    if rotational is True:
+        return 4
+    if rotational is False:
+        return 16
+    return 8
+
 # ------------- instance discovery -------------
 
 def probable_instance_dirs():
@@ -136,22 +791,41 @@ def probable_instance_dirs():
             uniq.append(rp)
     return uniq
 
+# Basic heuristic: an instance folder contains one of these. Compared
+# lowercased, like SKIP_DIRNAMES, for case-insensitive Windows and macOS volumes.
+INSTANCE_MARKERS = frozenset({"mods", "config", "resourcepacks", ".minecraft"})
+
+def looks_like_instance(path):
+    # One directory listing instead of an exists() round trip per marker
+    try:
+        with os.scandir(path) as it:
+            return any(entry.name.lower() in INSTANCE_MARKERS for entry in it)
+    except OSError:
+        return False
+
 def list_instances(root_dir: Path):
-    # For CurseForge and Prism, each subfolder is an instance
-    instances = []
+    # For CurseForge and Prism, each subfolder is an instance. Children are
+    # checked in parallel since every check is a round trip on network drives.
     try:
-        for child in sorted(root_dir.iterdir()):
-            if child.is_dir():
-                # Basic heuristic: must contain mods or config or resourcepacks
-                has_content = any((child / sub).exists() for sub in ("mods", "config", "resourcepacks", ".minecraft"))
-                if has_content:
-                    instances.append(child)
-    except Exception:
-        pass
-    return instances
+        with os.scandir(root_dir) as it:
+            children = sorted(Path(entry.path) for entry in it if entry.is_dir())
+    except OSError:
+        return []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        hits = list(pool.map(looks_like_instance, children))
+    return [child for child, hit in zip(children, hits) if hit]
+
+def find_instances(root: Path):
+    # The root itself when it looks like an instance, then its instance subfolders
+    candidates = [root] if looks_like_instance(root) else []
+    candidates.extend(list_instances(root))
+    return candidates
 
 # ------------- GUI -------------
 
+# Log lines and progress updates are written to Tk at most this often
+UI_FLUSH_MS = 100
+
 class CacheWarmerGUI(tk.Tk):
 
     def _detect_curseforge(self):
@@ -274,6 +948,14 @@ class CacheWarmerGUI(tk.Tk):
         self.limit_gb_var = tk.DoubleVar(value=8.0)
         self.dry_run_var = tk.BooleanVar(value=False)
 
+        self._ui_lock = threading.Lock()
+        self._log_pending = deque()
+        self._progress_pending = None
+        self._flush_scheduled = False
+
+        # (root, root mtime) -> instance folders found under it
+        self._instance_cache = {}
+
         self._build()
 
         # Theme guard. Some Homebrew Python builds do not get Aqua. Pick a safe theme.
@@ -312,6 +994,8 @@ class CacheWarmerGUI(tk.Tk):
         left.pack(side="left", fill="both", expand=True)
 
         ttk.Label(left, text="Instances").pack(anchor="w")
+        self.scan_label = ttk.Label(left, text="")
+        self.scan_label.pack(anchor="w")
         self.instances_list = tk.Listbox(left, selectmode="extended")
         self.instances_list.pack(fill="both", expand=True, pady=4)
 
@@ -368,11 +1052,38 @@ class CacheWarmerGUI(tk.Tk):
             top.grid_columnconfigure(col, weight=1)
 
     def _append_log(self, line):
-        self.log.configure(state="normal")
-        self.log.insert("end", line + "\n")
-        self.log.see("end")
-        self.log.configure(state="disabled")
-        self.update_idletasks()
+        # Called from the UI and the warm worker. Lines are queued and written
+        # in one insert per flush, a redraw per line stalls Tk on big packs.
+        with self._ui_lock:
+            self._log_pending.append(line)
+        self._schedule_flush()
+
+    def _set_progress(self, value):
+        # Only the latest value matters, earlier ones are dropped
+        with self._ui_lock:
+            self._progress_pending = value
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        with self._ui_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.after(UI_FLUSH_MS, self._flush_ui)
+
+    def _flush_ui(self):
+        with self._ui_lock:
+            lines = list(self._log_pending)
+            self._log_pending.clear()
+            value, self._progress_pending = self._progress_pending, None
+            self._flush_scheduled = False
+        if lines:
+            self.log.configure(state="normal")
+            self.log.insert("end", "\n".join(lines) + "\n")
+            self.log.see("end")
+            self.log.configure(state="disabled")
+        if value is not None:
+            self.progress["value"] = value
 
     def _refresh_roots(self):
         items = [str(p) for p in self.detected_roots]
@@ -396,13 +1107,35 @@ class CacheWarmerGUI(tk.Tk):
         if not sel:
             return
         root = Path(sel)
-        # If the selected root itself looks like an instance, show it
-        candidates = []
-        if any((root / sub).exists() for sub in ("mods", "config", "resourcepacks", ".minecraft")):
-            candidates.append(root)
-        # Also list subfolders that look like instances
-        candidates.extend(list_instances(root))
+        try:
+            key = (sel, os.stat(root).st_mtime_ns)
+        except OSError:
+            key = None
+        if key in self._instance_cache:
+            self.scan_label.configure(text="")
+            self._show_instances(root, self._instance_cache[key])
+            return
 
+        # Scanning can take seconds on a network drive, keep Tk responsive
+        self.scan_label.configure(text="Wait...")
+
+        def scan():
+            candidates = find_instances(root)
+            self.after(0, done, candidates)
+
+        def done(candidates):
+            if key is not None:
+                self._instance_cache[key] = candidates
+            # The user may have picked another root while this one was scanning
+            if self.roots_combo.get() != sel:
+                return
+            self.scan_label.configure(text="")
+            self._show_instances(root, candidates)
+
+        threading.Thread(target=scan, daemon=True).start()
+
+    def _show_instances(self, root, candidates):
+        self.instances_list.delete(0, "end")
         names = []
         for c in candidates:
             # Present simple names but store paths
@@ -415,10 +1148,10 @@ class CacheWarmerGUI(tk.Tk):
                 continue
 
         # keep a simple mapping
-        self._instance_map = {}
-        for i, (name, path) in enumerate(names):
+        self._instance_map = []
+        for name, path in names:
             self.instances_list.insert("end", name)
-            self._instance_map[i] = path
+            self._instance_map.append(path)
 
         self._append_log(f"Found {len(names)} instance folder(s) under {root}")
 
@@ -441,20 +1174,32 @@ class CacheWarmerGUI(tk.Tk):
         self.stop_btn.configure(state="normal")
         self._stop_flag = False
 
+        def finish(launch):
+            # Runs on the Tk thread after everything the worker queued, so the
+            # last log lines are written before the buttons come back
+            self._flush_ui()
+            self.warm_btn.configure(state="normal")
+            self.stop_btn.configure(state="disabled")
+            if launch:
+                self._maybe_launch(targets)
+
         def worker():
+            launch = False
             try:
                 patterns = DEFAULT_PATTERNS
                 budget = int(limit_gb * 1024 * 1024 * 1024)
                 warmed_total = 0
+                hot_total = 0
                 t0 = time.time()
 
                 total_files = 0
                 temp_lists = {}
                 for t in targets:
+                    prime_dir_cache(t)
                     files = list(iter_files(t, patterns))
                     temp_lists[str(t)] = files
                     total_files += len(files)
-                self.progress.configure(maximum=max(1, total_files))
+                self.after(0, self.progress.configure, {"maximum": max(1, total_files)})
                 progressed = 0
 
                 for t in targets:
@@ -462,55 +1207,77 @@ class CacheWarmerGUI(tk.Tk):
                     if self._stop_flag:
                         break
                     self._append_log(f"Start {t}")
-                    files = list(iter_files(t, patterns))
-
-                    def weight(p: Path):
-                        name = p.name.lower()
-                        if name.endswith(".jar"):
-                            return 0
-                        if name.endswith(".zip"):
-                            return 1
-                        if name.endswith(".json") or name.endswith(".toml") or name.endswith(".cfg") or name.endswith(".ini"):
-                            return 2
-                        if name.endswith(".png") or name.endswith(".ogg") or name.endswith(".wav"):
-                            return 3
-                        return 4
 
-                    files.sort(key=lambda p: (weight(p), -p.stat().st_size))
+                    rotational = _probe_device(t)
+                    sort_for_warm(files, rotational)
 
                     warmed = 0
-                    for i, fpath in enumerate(files, 1):
-                        self.progress["value"] = progressed
-                        self.progress.update_idletasks()
-                        if self._stop_flag:
-                            break
-                        size = fpath.stat().st_size
-                        if dry:
-                            self._append_log(f"[{i:5d}/{len(files)}] plan {fpath} {human(size)}")
-                            continue
-                        if warmed_total >= budget:
+                    if dry:
+                        for i, (fpath, st, _) in enumerate(files, 1):
+                            if self._stop_flag:
+                                break
+                            self._append_log(f"[{i:5d}/{len(files)}] plan {fpath} {human(st.st_size)}")
+                        self._append_log(f"Done {t} warmed {human(warmed)}")
+                        continue
+
+                    # Sizes are known up front, so the budget decides what gets
+                    # submitted instead of being checked per file
+                    plan = []
+                    pending = 0
+                    for i, (fpath, st, _) in enumerate(files, 1):
+                        size = st.st_size
+                        if warmed_total + pending >= budget:
                             self._append_log(f"Hit limit {limit_gb} GB. Stopping.")
                             break
-                        try:
-                            rb = warm_file(fpath)
-                            warmed += rb
-                            warmed_total += rb
-                            self._append_log(f"[{i:5d}] warmed {fpath} {human(rb)}  total {human(warmed_total)}")
-                            progressed += 1
-                        except Exception as e:
-                            self._append_log(f"[{i:5d}] error {fpath}: {e}")
-                        finally:
-                            progressed += 1
+                        plan.append((i, fpath, size))
+                        pending += size
+
+                    with ThreadPoolExecutor(max_workers=io_workers(rotational)) as pool:
+                        group_max = batch_size()
+                        futures = {}
+                        small = []
+                        for i, fpath, size in plan:
+                            if self._stop_flag:
+                                break
+                            if size <= BATCH_FILE_MAX:
+                                small.append((i, fpath, size))
+                                if len(small) < group_max:
+                                    continue
+                                group, small = small, []
+                            else:
+                                group = [(i, fpath, size)]
+                            futures[pool.submit(warm_batch, [(f, n) for _, f, n in group], rotational)] = group
+                        if small and not self._stop_flag:
+                            futures[pool.submit(warm_batch, [(f, n) for _, f, n in small], rotational)] = small
+                        for fut in as_completed(futures):
+                            if self._stop_flag:
+                                for f in futures:
+                                    f.cancel()
+                                break
+                            for (i, fpath, _), res in zip(futures[fut], fut.result()):
+                                if isinstance(res, Exception):
+                                    self._append_log(f"[{i:5d}] error {fpath}: {res}")
+                                else:
+                                    rb, hot = res
+                                    warmed += rb
+                                    warmed_total += rb
+                                    if hot:
+                                        hot_total += 1
+                                        self._append_log(f"[{i:5d}] hot {fpath} {human(rb)}  total {human(warmed_total)}")
+                                    else:
+                                        self._append_log(f"[{i:5d}] warmed {fpath} {human(rb)}  total {human(warmed_total)}")
+                                progressed += 1
+                            self._set_progress(progressed)
 
                     self._append_log(f"Done {t} warmed {human(warmed)}")
 
                 dt = time.time() - t0
                 self._append_log(f"All done in {dt:.1f}s. Total warmed {human(warmed_total)}")
-                self.progress["value"] = self.progress["maximum"]
-                self._maybe_launch(targets)
+                self._append_log(f"Already-hot files skipped: {hot_total}")
+                self._set_progress(max(1, total_files))
+                launch = True
             finally:
-                self.warm_btn.configure(state="normal")
-                self.stop_btn.configure(state="disabled")
+                self.after(0, finish, launch)
 
         threading.Thread(target=worker, daemon=True).start()
 